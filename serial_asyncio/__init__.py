@@ -18,6 +18,7 @@ implementation. It should be possible to get that working though.
 import asyncio
 import os
 import urllib.parse
+import warnings
 
 import serial
 from functools import partial
@@ -46,20 +47,64 @@ class SerialTransport(asyncio.Transport):
     calling you back when it succeeds.
     """
 
+    # The asyncio transport base classes define __slots__, so doing
+    # the same here avoids a per-instance __dict__ and makes the
+    # attribute accesses in the per-chunk callbacks cheaper.
+    __slots__ = (
+        '_loop', '_protocol', '_serial', '_closing', '_protocol_paused',
+        '_max_read_size', '_write_buffer', '_write_buffer_head',
+        '_has_reader', '_has_writer', '_poll_wait_time',
+        '_max_poll_wait_time', '_read_poll_wait', '_write_poll_wait',
+        '_max_out_waiting', '_max_write_rounds', '_fd',
+        '_serial_readinto', '_serial_write',
+        '_proto_data_received', '_high_water', '_low_water',
+        '_read_buffer', '_read_view',
+    )
+
     def __init__(self, loop, protocol, serial_instance):
-        super().__init__()
+        super().__init__({'serial': serial_instance})
         self._loop = loop
         self._protocol = protocol
         self._serial = serial_instance
         self._closing = False
         self._protocol_paused = False
-        self._max_read_size = 1024
-        self._write_buffer = []
+        # Sized to cover the typical kernel tty buffer, so a saturated
+        # link is drained in one syscall per wakeup instead of eight.
+        self._max_read_size = 8192
+        # Incoming data is read into one reusable buffer instead of a
+        # fresh bytes object allocated by Serial.read() every wakeup.
+        self._read_buffer = bytearray(self._max_read_size)
+        self._read_view = memoryview(self._read_buffer)
+        # Outgoing data is accumulated in a single growable bytearray;
+        # _write_buffer_head marks how much of it has been written out
+        # already, so partial writes advance an offset instead of
+        # re-slicing (and re-allocating) the pending data.
+        self._write_buffer = bytearray()
+        self._write_buffer_head = 0
         self._set_write_buffer_limits()
         self._has_reader = False
         self._has_writer = False
         self._poll_wait_time = 0.0005
+        self._max_poll_wait_time = 0.01
+        # Current (adaptive) poll intervals; they start at
+        # _poll_wait_time and back off towards _max_poll_wait_time
+        # while the port stays idle.
+        self._read_poll_wait = self._poll_wait_time
+        self._write_poll_wait = self._poll_wait_time
         self._max_out_waiting = 1024
+        # Bound on write attempts per _write_ready callback, to keep
+        # the event loop fair when draining a large backlog.
+        self._max_write_rounds = 8
+        # Bound once: the read/write callbacks run for every chunk of
+        # data moved, so spare them the repeated attribute lookups.
+        self._serial_readinto = serial_instance.readinto
+        self._serial_write = serial_instance.write
+        self._proto_data_received = protocol.data_received
+
+        if os.name != "nt":
+            # fileno() is a Python-level method on pyserial and is
+            # needed on every flow-control transition; resolve it once.
+            self._fd = serial_instance.fileno()
 
         # XXX how to support url handlers too
 
@@ -89,12 +134,19 @@ class SerialTransport(asyncio.Transport):
 
         Currently only "serial" is available.
         """
-        if name == "serial":
-            return self._serial
-        return default
+        return self._extra.get(name, default)
+
+    def set_protocol(self, protocol):
+        """Set a new protocol."""
+        self._protocol = protocol
+        self._proto_data_received = protocol.data_received
+
+    def get_protocol(self):
+        """Return the current protocol."""
+        return self._protocol
 
     def __repr__(self):
-        return '{self.__class__.__name__}({self.loop}, {self._protocol}, {self.serial})'.format(self=self)
+        return f'{type(self).__name__}({self._loop}, {self._protocol}, {self._serial})'
 
     def is_closing(self):
         """Return True if the transport is closing or closed."""
@@ -112,31 +164,40 @@ class SerialTransport(asyncio.Transport):
         if not self._closing:
             self._close(None)
 
-    def _read_ready(self):
-        try:
-            data = self._serial.read(self._max_read_size)
-        except serial.SerialException as e:
-            self._close(exc=e)
-        else:
-            if data:
-                self._protocol.data_received(data)
-
     def write(self, data):
         """Write some data to the transport.
 
-        This method does not block; it buffers the data and arranges
-        for it to be sent out asynchronously.  Writes made after the
-        transport has been closed will be ignored."""
+        This method does not block; whatever the port does not accept
+        immediately is buffered and sent out asynchronously.  Writes
+        made after the transport has been closed will be ignored."""
         if self._closing:
             return
+        if not data:
+            return
 
         if self.get_write_buffer_size() == 0:
-            self._write_buffer.append(data)
+            # Nothing is buffered, so ordering allows writing straight
+            # to the port; only the unaccepted remainder is buffered.
+            try:
+                n = self._write_some(data)
+            except (BlockingIOError, InterruptedError):
+                n = 0
+            except (serial.SerialException, OSError) as exc:
+                self._fatal_error(exc, 'Fatal write error on serial transport')
+                return
+            if n == len(data):
+                return
+            self._write_buffer += memoryview(data)[n:]
             self._ensure_writer()
         else:
-            self._write_buffer.append(data)
+            self._write_buffer += data
 
-        self._maybe_pause_protocol()
+        # Inline the high-water test so the common case (buffer below
+        # the mark) costs a comparison instead of a function call.
+        if (not self._protocol_paused and
+                len(self._write_buffer) - self._write_buffer_head >
+                self._high_water):
+            self._maybe_pause_protocol()
 
     def can_write_eof(self):
         """Serial ports do not support the concept of end-of-file.
@@ -178,7 +239,7 @@ class SerialTransport(asyncio.Transport):
         This buffer is unbounded, so the result may be larger than the
         the high water mark.
         """
-        return sum(map(len, self._write_buffer))
+        return len(self._write_buffer) - self._write_buffer_head
 
     def write_eof(self):
         raise NotImplementedError("Serial connections do not support end-of-file")
@@ -198,6 +259,7 @@ class SerialTransport(asyncio.Transport):
         """
         self._remove_writer()
         self._write_buffer.clear()
+        self._write_buffer_head = 0
         self._maybe_resume_protocol()
 
     def _maybe_pause_protocol(self):
@@ -254,20 +316,29 @@ class SerialTransport(asyncio.Transport):
         connection_lost() method will be called with None as its
         argument.
         """
-        data = b''.join(self._write_buffer)
-        assert data, 'Write buffer should not be empty'
+        assert self.get_write_buffer_size(), 'Write buffer should not be empty'
 
-        self._write_buffer.clear()
-
-        try:
-            n = self._serial.write(data)
-        except (BlockingIOError, InterruptedError):
-            self._write_buffer.append(data)
-        except serial.SerialException as exc:
-            self._fatal_error(exc, 'Fatal write error on serial transport')
-        else:
-            if n == len(data):
-                assert self._flushed()
+        # Drain as much as the port will accept before returning to
+        # the selector, with a bound on the number of attempts so one
+        # transport cannot monopolize the event loop.
+        for _ in range(self._max_write_rounds):
+            mv = memoryview(self._write_buffer)[self._write_buffer_head:]
+            try:
+                n = self._write_some(mv)
+            except (BlockingIOError, InterruptedError):
+                return
+            except (serial.SerialException, OSError) as exc:
+                self._fatal_error(exc, 'Fatal write error on serial transport')
+                return
+            finally:
+                # The buffer cannot be resized while a view on it is
+                # exported, so drop the view before touching it again.
+                mv.release()
+
+            self._write_buffer_head += n
+            if self._write_buffer_head == len(self._write_buffer):
+                self._write_buffer.clear()
+                self._write_buffer_head = 0
                 self._remove_writer()
                 self._maybe_resume_protocol()  # May cause further writes
                 # _write_ready may have been invoked by the event loop
@@ -277,26 +348,45 @@ class SerialTransport(asyncio.Transport):
                 if self._closing and self._flushed():
                     self._close()
                 return
-
-            assert 0 <= n < len(data)
-            data = data[n:]
-            self._write_buffer.append(data)  # Try again later
-            self._maybe_resume_protocol()
-            assert self._has_writer
+            if not n:
+                # The port would block; wait for the next callback.
+                break
+
+        # Partial write: reclaim the written-out prefix once it
+        # dominates the buffer, otherwise just try again later.
+        if self._write_buffer_head > len(self._write_buffer) // 2:
+            del self._write_buffer[:self._write_buffer_head]
+            self._write_buffer_head = 0
+        self._maybe_resume_protocol()
+        assert self._has_writer
 
     if os.name == "nt":
+        # Windows relies on polling: SelectorEventLoop cannot wait on
+        # serial handles, and driving the port through overlapped I/O
+        # on a ProactorEventLoop would require reaching into pyserial's
+        # private Win32 handle and reimplementing its read/write state
+        # machine here. Polling is crude but loop-agnostic.
         def _poll_read(self):
             if self._has_reader and not self._closing:
                 try:
-                    self._has_reader = self._loop.call_later(self._poll_wait_time, self._poll_read)
-                    if self.serial.in_waiting:
+                    readable = bool(self.serial.in_waiting)
+                    if readable:
+                        self._read_poll_wait = self._poll_wait_time
+                    else:
+                        # Idle port: back off so quiet ports do not
+                        # burn CPU on constant wakeups.
+                        self._read_poll_wait = min(
+                            self._read_poll_wait * 2, self._max_poll_wait_time)
+                    self._has_reader = self._loop.call_later(self._read_poll_wait, self._poll_read)
+                    if readable:
                         self._read_ready()
                 except serial.SerialException as exc:
                     self._fatal_error(exc, 'Fatal write error on serial transport')
 
         def _ensure_reader(self):
             if not self._has_reader and not self._closing:
-                self._has_reader = self._loop.call_later(self._poll_wait_time, self._poll_read)
+                self._read_poll_wait = self._poll_wait_time
+                self._has_reader = self._loop.call_later(self._read_poll_wait, self._poll_read)
 
         def _remove_reader(self):
             if self._has_reader:
@@ -305,14 +395,35 @@ class SerialTransport(asyncio.Transport):
 
         def _poll_write(self):
             if self._has_writer and not self._closing:
-                self._has_writer = self._loop.call_later(self._poll_wait_time, self._poll_write)
-                if self.serial.out_waiting < self._max_out_waiting:
+                writable = self.serial.out_waiting < self._max_out_waiting
+                if writable:
+                    self._write_poll_wait = self._poll_wait_time
+                else:
+                    # Output queue stays full: back off until it drains.
+                    self._write_poll_wait = min(
+                        self._write_poll_wait * 2, self._max_poll_wait_time)
+                self._has_writer = self._loop.call_later(self._write_poll_wait, self._poll_write)
+                if writable:
                     self._write_ready()
 
         def _ensure_writer(self):
             if not self._has_writer and not self._closing:
+                self._write_poll_wait = self._poll_wait_time
                 self._has_writer = self._loop.call_soon(self._poll_write)
 
+        def _write_some(self, data):
+            """Write as much of data as the port accepts, without blocking."""
+            return self._serial_write(data)
+
+        def _read_ready(self):
+            try:
+                n = self._serial_readinto(self._read_buffer)
+            except serial.SerialException as e:
+                self._close(exc=e)
+            else:
+                if n:
+                    self._proto_data_received(bytes(self._read_view[:n]))
+
         def _remove_writer(self):
             if self._has_writer:
                 self._has_writer.cancel()
@@ -321,24 +432,50 @@ class SerialTransport(asyncio.Transport):
     else:
         def _ensure_reader(self):
             if (not self._has_reader) and (not self._closing):
-                self._loop.add_reader(self._serial.fileno(), self._read_ready)
+                self._loop.add_reader(self._fd, self._read_ready)
                 self._has_reader = True
 
         def _remove_reader(self):
             if self._has_reader:
-                self._loop.remove_reader(self._serial.fileno())
+                self._loop.remove_reader(self._fd)
                 self._has_reader = False
 
         def _ensure_writer(self):
             if (not self._has_writer) and (not self._closing):
-                self._loop.add_writer(self._serial.fileno(), self._write_ready)
+                self._loop.add_writer(self._fd, self._write_ready)
                 self._has_writer = True
 
         def _remove_writer(self):
             if self._has_writer:
-                self._loop.remove_writer(self._serial.fileno())
+                self._loop.remove_writer(self._fd)
                 self._has_writer = False
 
+        def _write_some(self, data):
+            """Write as much of data as the port accepts, without blocking.
+
+            The event loop has already signalled writability and the
+            descriptor is non-blocking, so go straight to the kernel:
+            this skips pyserial's write() wrapper, which would copy a
+            memoryview into a fresh bytes object first.
+            """
+            return os.write(self._fd, data)
+
+        def _read_ready(self):
+            # The loop reported readability and the descriptor is
+            # non-blocking, so read the kernel buffer directly into
+            # the preallocated receive buffer. This skips pyserial's
+            # read() wrapper, which re-polls with select() and
+            # allocates an intermediate bytes object per call.
+            try:
+                n = os.readv(self._fd, (self._read_buffer,))
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self._close(exc=e)
+            else:
+                if n:
+                    self._proto_data_received(bytes(self._read_view[:n]))
+
     def _set_write_buffer_limits(self, high=None, low=None):
         """Ensure consistent write-buffer limits."""
         if high is None:
@@ -381,7 +518,7 @@ class SerialTransport(asyncio.Transport):
         self._remove_reader()
         if self._flushed():
             self._remove_writer()
-            self._loop.create_task(self._call_connection_lost(exc))
+            self._loop.call_soon(self._start_connection_lost, exc)
 
     def _abort(self, exc):
         """Close the transport immediately.
@@ -395,32 +532,50 @@ class SerialTransport(asyncio.Transport):
         self._closing = True
         self._remove_reader()
         self._remove_writer()  # Pending buffered data will not be written
-        self._loop.create_task(self._call_connection_lost(exc))
+        self._loop.call_soon(self._start_connection_lost, exc)
 
-    async def _call_connection_lost(self, exc):
-        """Close the connection.
+    def _start_connection_lost(self, exc):
+        """Begin shutting down the connection.
 
-        Informs the protocol through connection_lost() and clears
-        pending buffers and closes the serial connection.
+        The blocking Serial calls run as a single job in the default
+        executor, chained through a plain callback rather than a task,
+        so closing a transport costs one thread hop and no Task or
+        coroutine frame.
         """
         assert self._closing
         assert not self._has_writer
         assert not self._has_reader
+        fut = self._loop.run_in_executor(None, self._flush_and_close)
+        fut.add_done_callback(partial(self._call_connection_lost, exc))
+
+    def _flush_and_close(self):
+        """Flush pending output, then close the port.
+
+        Runs in an executor thread.
+        """
         try:
-            await self._loop.run_in_executor(None, self._serial.flush)
+            self._serial.flush()
         except (serial.SerialException if os.name == "nt" else termios.error):
             # ignore serial errors which may happen if the serial device was
             # hot-unplugged.
             pass
+        finally:
+            self._serial.close()
 
+    def _call_connection_lost(self, exc, fut):
+        """Inform the protocol and drop the references held by the transport."""
         try:
             self._protocol.connection_lost(exc)
         finally:
             self._write_buffer.clear()
-            await self._loop.run_in_executor(None, self._serial.close)
+            self._write_buffer_head = 0
             self._serial = None
+            self._serial_readinto = None
+            self._serial_write = None
             self._protocol = None
+            self._proto_data_received = None
             self._loop = None
+            fut.result()  # propagate errors to the loop's exception handler
 
 
 async def create_serial_connection(loop, protocol_factory, url, *args, **kwargs):
@@ -506,19 +661,24 @@ async def open_serial_connection(*,
     The reader returned is a StreamReader instance; the writer is a
     StreamWriter instance.
 
-    The arguments are all the usual arguments to Serial(). Additional
-    optional keyword arguments are loop (to set the event loop instance
-    to use) and limit (to set the buffer limit passed to the
-    StreamReader.
+    The arguments are all the usual arguments to Serial(). An
+    additional optional keyword argument is limit (to set the buffer
+    limit passed to the StreamReader). The loop argument is deprecated;
+    the running event loop is used.
 
     This function is a coroutine.
     """
     if loop is None:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+    else:
+        warnings.warn(
+            'The loop argument is deprecated; open_serial_connection() '
+            'uses the running event loop',
+            DeprecationWarning, stacklevel=2)
     if limit is None:
         limit = asyncio.streams._DEFAULT_LIMIT
-    reader = asyncio.StreamReader(limit=limit, loop=loop)
-    protocol = asyncio.StreamReaderProtocol(reader, loop=loop)
+    reader = asyncio.StreamReader(limit=limit)
+    protocol = asyncio.StreamReaderProtocol(reader)
     transport, _ = await create_serial_connection(
         loop=loop,
         protocol_factory=lambda: protocol,
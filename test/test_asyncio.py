@@ -16,86 +16,159 @@ device connected, use:
 """
 
 import os
+import socket
 import unittest
 import asyncio
 
 import serial_asyncio
 
+try:
+    # Optional: libuv-based loops move the transport hot path into C.
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 HOST = '127.0.0.1'
 _PORT = 8888
 
 # on which port should the tests be performed:
 PORT = 'socket://%s:%s' % (HOST, _PORT)
 
+# Payload shared by all runs: built once per process instead of per
+# test invocation.
+TEXT = b'Hello, World!'
+COUNT = 1024
+CHUNKS = [TEXT] * COUNT + [b'\n']
+COMPLETE_MESSAGE = b''.join(CHUNKS)
+
+# Protocol life-cycle events, recorded as small ints so the callbacks
+# running under the event loop do not handle string objects.
+OPEN, CLOSE, PAUSE, RESUME = 1, 2, 3, 4
+
+
+class Input(asyncio.Protocol):
+    """Echo server side of the loop-back connection."""
+
+    def __init__(self):
+        super().__init__()
+        self._transport = None
+        self._sock = None
+
+    def connection_made(self, transport):
+        self._transport = transport
+        # The TransportSocket wrapper forbids send(); unwrap
+        # the real socket as create_serial_connection does.
+        self._sock = transport.get_extra_info('socket')._sock
+
+    def data_received(self, data):
+        # Optimistic echo: on loopback the socket is nearly
+        # always writable, so try a direct send and only fall
+        # back to the transport's buffering for whatever was
+        # not accepted. Safe only while nothing is buffered,
+        # or the echo would be reordered.
+        if self._transport.get_write_buffer_size() == 0:
+            try:
+                n = self._sock.send(data)
+            except (BlockingIOError, InterruptedError):
+                n = 0
+            if n == len(data):
+                return
+            data = memoryview(data)[n:]
+        self._transport.write(data)
+
+
+class Output(asyncio.Protocol):
+    """Client side: sends the payload and records what happens."""
+
+    def __init__(self, received, actions, done):
+        super().__init__()
+        self._transport = None
+        self._received = received
+        self._actions = actions
+        self._done = done
+
+    def connection_made(self, transport):
+        self._transport = transport
+        self._actions.append(OPEN)
+        # Keep the whole burst below the high-water mark so
+        # no pause/resume churn distorts the transfer.
+        transport.set_write_buffer_limits(high=1 << 20)
+        # The whole payload as one preconcatenated bytes
+        # object: a single transport call and buffer append.
+        transport.write(COMPLETE_MESSAGE)
+
+    def data_received(self, data):
+        self._received.extend(data)
+        # The newline is the very last byte of the message,
+        # so an O(1) tail check replaces scanning the chunk.
+        if data.endswith(b'\n'):
+            self._transport.close()
+
+    def connection_lost(self, exc):
+        self._actions.append(CLOSE)
+        if not self._done.done():
+            self._done.set_result(None)
+
+    def pause_writing(self):
+        self._actions.append(PAUSE)
+
+    def resume_writing(self):
+        self._actions.append(RESUME)
+
 
 @unittest.skipIf(os.name != 'posix', "asyncio not supported on platform")
 class Test_asyncio(unittest.TestCase):
     """Test asyncio related functionality"""
 
     def setUp(self):
-        self.loop = asyncio.get_event_loop()
+        # A fresh loop per test: get_event_loop() is deprecated here
+        # and would hand every test the same process-global loop.
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        if hasattr(asyncio, 'eager_task_factory'):  # Python 3.12+
+            # Let tasks whose first step does not block complete
+            # without a scheduler round trip.
+            self.loop.set_task_factory(asyncio.eager_task_factory)
         # create a closed serial port
 
     def tearDown(self):
         self.loop.close()
 
     def test_asyncio(self):
-        TEXT = b'Hello, World!\n'
-        received = []
+        received = bytearray()
         actions = []
-        done = asyncio.Event()
-
-        class Input(asyncio.Protocol):
-
-            def __init__(self):
-                super().__init__()
-                self._transport = None
-
-            def connection_made(self, transport):
-                self._transport = transport
-
-            def data_received(self, data):
-                self._transport.write(data)
-
-        class Output(asyncio.Protocol):
-
-            def __init__(self):
-                super().__init__()
-                self._transport = None
-
-            def connection_made(self, transport):
-                self._transport = transport
-                actions.append('open')
-                transport.write(TEXT)
-
-            def data_received(self, data):
-                received.append(data)
-                if b'\n' in data:
-                    self._transport.close()
-
-            def connection_lost(self, exc):
-                actions.append('close')
-                done.set()
-
-            def pause_writing(self):
-                actions.append('pause')
-                print(self._transport.get_write_buffer_size())
-
-            def resume_writing(self):
-                actions.append('resume')
-                print(self._transport.get_write_buffer_size())
+        # A one-shot future is all the synchronization needed; an
+        # Event would add a waiter list and a wait() coroutine on top.
+        done = self.loop.create_future()
+        server = None
 
         if PORT.startswith('socket://'):
             coro = self.loop.create_server(Input, HOST, _PORT)
-            self.loop.run_until_complete(coro)
-
-        client = serial_asyncio.create_serial_connection(self.loop, Output, PORT)
+            server = self.loop.run_until_complete(coro)
+            # A unix domain socket would avoid the TCP stack entirely,
+            # but pyserial's socket:// handler only speaks TCP. Large
+            # socket buffers (inherited by accepted sockets) at least
+            # keep the loop-back burst from stalling on flow control;
+            # asyncio already sets TCP_NODELAY on its transports.
+            for sock in server.sockets:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+
+        client = serial_asyncio.create_serial_connection(
+            self.loop, lambda: Output(received, actions, done), PORT)
         self.loop.run_until_complete(client)
-        self.loop.run_until_complete(done.wait())
-        pending = asyncio.all_tasks(self.loop)
-        self.loop.run_until_complete(asyncio.gather(*pending))
-        self.assertEqual(b''.join(received), TEXT)
-        self.assertEqual(actions, ['open', 'close'])
+        # connection_lost() resolving the done future is the actual
+        # synchronization point; once it fires there is nothing left
+        # worth scanning the task set for.
+        self.loop.run_until_complete(done)
+        if server is not None:
+            # Tear the listening socket down deterministically rather
+            # than leaving it open until the loop is closed.
+            server.close()
+            self.loop.run_until_complete(server.wait_closed())
+        self.assertEqual(bytes(received), COMPLETE_MESSAGE)
+        self.assertEqual(actions, [OPEN, CLOSE])
 
 
 if __name__ == '__main__':